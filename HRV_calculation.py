@@ -159,7 +159,8 @@ def calculate_mean_HRV_based_on_windows(row, method):
     --------
       *row*: (Pandas series) modified *row*
     """
-    elements = np.array(row[f'HRV_{method}'])
+    column = f'HRV_{method}'
+    elements = np.array(row[column])
     timestamps = np.array(row['timestamps'])
     # Zeros are not wrong elements for 'pNN50' method
     if method == 'pNN50':
@@ -169,11 +170,52 @@ def calculate_mean_HRV_based_on_windows(row, method):
         indices_of_wrong_elements = np.where(
             elements < 1e-6)
     elements = np.delete(elements, indices_of_wrong_elements)
-    row[f'HRV_{method}'] = np.mean(elements)
+    row[column] = np.mean(elements)
     row['timestamps'] = list(np.delete(timestamps, indices_of_wrong_elements))
     return row
 
 
+def calculate_mean_HRV_based_on_windows_for_all_persons(results, method):
+    """
+    Calculate mean HRV based on partial HRV results for all persons
+    at once, omitting wrong elements in the same way as
+    calculate_mean_HRV_based_on_windows().
+
+    Arguments:
+    ----------
+      *results*: (Pandas dataframe) contains results for all persons;
+                 one of the columns is called f'HRV_{method}' and
+                 stores lists of partial HRV results
+      *method*: (string) the name of the method of HRV calculation
+
+    Returns:
+    --------
+      *mean_HRV*: (Numpy array) mean HRV for consecutive persons
+    """
+    elements = [np.ravel(np.asarray(value, dtype=np.float64))
+                for value in results[f'HRV_{method}']]
+    lengths = np.array([element.shape[0] for element in elements])
+    no_of_persons = lengths.shape[0]
+    if lengths.sum() == 0:
+        return np.full(no_of_persons, np.nan)
+    # All partial results in one array, labelled by the person index
+    elements = np.concatenate(elements)
+    persons = np.repeat(np.arange(no_of_persons), lengths)
+    # Zeros are not wrong elements for 'pNN50' method
+    if method == 'pNN50':
+        correct_elements = np.ones(elements.shape[0], dtype=bool)
+    else:
+        correct_elements = ~(elements < 1e-6)
+    sums = np.bincount(persons,
+                       weights=np.where(correct_elements, elements, 0),
+                       minlength=no_of_persons)
+    counts = np.bincount(persons,
+                         weights=correct_elements,
+                         minlength=no_of_persons)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+
 def get_indices_from_slides(element):
     # Prepare a conversion
     element = element.index.to_series()
@@ -391,7 +433,7 @@ def calculate_HRV_in_windows(data: pd.DataFrame,
         if not path_with_filename:
             path_with_filename = './RR_filtered_intervals_with_time.pkl'
         with open(path_with_filename, 'wb') as f:
-            pickle.dump(divided_series, f)
+            pickle.dump(divided_series, f, protocol=pickle.HIGHEST_PROTOCOL)
     # Calculate HRV values according to the selected method
     HRV_divided_series = np.zeros(len(divided_series))
     median_timestamps = np.zeros(len(divided_series), dtype='datetime64[ns]')
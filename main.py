@@ -49,8 +49,11 @@ Medical University of Silesia, Tarnowskie Góry, Poland;
 Tarnowskie Góry, Poland.
 """
 
-from itertools import product
+from itertools import product, repeat
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
+import matplotlib
 import pandas as pd
 import numpy as np
 
@@ -79,6 +82,7 @@ from utils_loading import (
     load_and_preprocess_data_for_single_person
 )
 from utils_others import (
+    GROUPS_DTYPE,
     compare_means_and_variances_in_groups,
     filter_patients_with_quetiapine
 )
@@ -195,15 +199,46 @@ def pipeline_load_data_and_calculate_HRV(
             'Wrong mode of "sequence_range" in "parameters" dict.')
 
 
-def experiment_1_calculate_HRV(parameters):
+def calculate_HRV_for_single_person(group, person, parameters):
+    """
+    Run the HRV pipeline for a selected person and prepare its results
+    for storing in the summary dataframe.
+
+    Arguments:
+    ----------
+        *group* (str) - the name of the person's group
+        *person* (int) - number of the person in 'group'
+        *parameters* - dictionary with parameters of the experiment,
+                       as in 'pipeline_load_data_and_calculate_HRV'
+
+    Returns:
+    --------
+    Results of the person prepared by 'store_HRV_results_different_methods'
+    """
+    _, HRV_results, timestamps = pipeline_load_data_and_calculate_HRV(
+        group,
+        person,
+        parameters
+    )
+    return store_HRV_results_different_methods(
+        HRV_results,
+        timestamps,
+        group,
+        person
+    )
+
+
+def experiment_1_calculate_HRV(parameters, max_workers=None):
     """
     Load data from the initial series of experiments,
     based on data collected between April and September 2022.
+    Persons are processed independently in separate processes;
+    -max_workers- limits their number (all CPUs by default).
 
     Returns a Pandas dataframe with mean HRV for both
     'control' and 'treatment' group.
     """
-    results = []
+    tasks = []
     for group in ['control', 'treatment']:
         for person in range(1, 49):
             if (group == 'treatment' and (
@@ -214,19 +249,20 @@ def experiment_1_calculate_HRV(parameters):
                 person in [1, 3, 4, 5, 6, 7, 8, 9, 10, 11,
                            12, 13, 14, 15, 17, 23, 27, 48])):
                 continue
-            _, HRV_results, timestamps = pipeline_load_data_and_calculate_HRV(
-                group,
-                person,
-                parameters
-            )
-            results.append(
-                store_HRV_results_different_methods(
-                    HRV_results,
-                    timestamps,
-                    group,
-                    person
-                )
-            )
+            tasks.append((group, person))
+    # Only the HRV results are sent back, not the preprocessed data;
+    # the order of results follows the order of tasks. Workers are
+    # spawned, not forked, because the parent process may already
+    # have drawn figures with an initialised Matplotlib backend.
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn')) as executor:
+        results = list(executor.map(
+            calculate_HRV_for_single_person,
+            [group for group, _ in tasks],
+            [person for _, person in tasks],
+            repeat(parameters)
+        ))
     dataframe = create_dataframe_from_HRV_results_different_methods(
         results,
         method=parameters['method']
@@ -235,6 +271,8 @@ def experiment_1_calculate_HRV(parameters):
 
 
 if __name__ == "__main__":
+    # Plots are only saved to files, so no GUI backend is needed
+    matplotlib.use('Agg')
     main_folder = (
         '/data/anonimized_raw_data/'
     )
@@ -330,6 +368,8 @@ if __name__ == "__main__":
             )
             PANSS.insert(0, "group", "treatment")
             merged_results = full_results.merge(PANSS, how='outer')
+            merged_results['group'] = \
+                merged_results['group'].astype(GROUPS_DTYPE)
 
             save_parameters(parameters)
             processed_data, treatment_results = save_results(
@@ -59,6 +59,7 @@ import matplotlib.dates as mdates
 from HRV_calculation import (
     calculate_HRV_in_windows,
     calculate_mean_HRV_based_on_windows,
+    calculate_mean_HRV_based_on_windows_for_all_persons,
     filter_windows_with_chunked_dataframe,
     prepare_windows_any_frequency_any_step,
     RMSSD_HRV_calculation,
@@ -487,6 +488,27 @@ class Test(unittest.TestCase):
         )
         assert_series_equal(result_series_2, gt_series_2)
 
+    def test_calculate_mean_HRV_on_windows_for_all_persons(self):
+        test_dataframe = pd.DataFrame({
+            'group': ['treatment', 'control', 'treatment'],
+            'no_of_person': [1, 4, 5],
+            'HRV_RMSSD': [[2.20, 1.15, 0.0, 0, 2, 3, 7, 0.0],
+                          [3, 5, 8, 4, 5],
+                          np.nan]
+        })
+        result_1 = calculate_mean_HRV_based_on_windows_for_all_persons(
+            test_dataframe, 'RMSSD'
+        )
+        assert_allclose(result_1, [3.07, 5, np.nan])
+
+        # Zeros are taken into account for pNN50
+        test_dataframe = test_dataframe.rename(
+            columns={'HRV_RMSSD': 'HRV_pNN50'})
+        result_2 = calculate_mean_HRV_based_on_windows_for_all_persons(
+            test_dataframe, 'pNN50'
+        )
+        assert_allclose(result_2, [1.91875, 5, np.nan])
+
     def test_calculate_HRV_in_windows(self):
         def calculate_median_timestamp_based_on_pydatetimes(times):
             return pd.Timestamp(mdates.num2date(
@@ -0,0 +1,121 @@
+"""
+Copyright 2023-2024
+Institute of Theoretical and Applied Informatics,
+Polish Academy of Sciences (ITAI PAS) https://www.iitis.pl
+
+The main author of the code:
+- Kamil Książek (ITAI PAS, ORCID ID: 0000-0002-0201-6220).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+---
+Polar HRV Data Analysis Library (PDAL) v 1.1
+---
+
+A source code to the paper:
+
+The analysis of heart rate variability and accelerometer mobility data
+in the assessment of symptom severity in psychosis disorder patients
+using a wearable Polar H10 sensor
+
+Authors:
+- Kamil Książek (ITAI PAS, ORCID ID: 0000-0002-0201-6220),
+- Wilhelm Masarczyk (FMS MUS, ORCID ID: 0000-0001-9516-0709),
+- Przemysław Głomb (ITAI PAS, ORCID ID: 0000-0002-0215-4674),
+- Michał Romaszewski (ITAI PAS, ORCID ID: 0000-0002-8227-929X),
+- Iga Stokłosa (FMS UMS, ORCID ID: 0000-0002-7283-5491),
+- Piotr Ścisło (PDMH, ORCID ID: 0000-0003-1213-2935),
+- Paweł Dębski (FMS UMS, ORCID ID: 0000-0001-5904-6407),
+- Robert Pudlo (FMS UMS, ORCID ID: 0000-0002-5748-0063),
+- Piotr Gorczyca (FMS UMS, ORCID ID: 0000-0002-9419-7988),
+- Magdalena Piegza (FMS UMS, ORCID ID: 0000-0002-8009-7118).
+
+*ITAI PAS* - Institute of Theoretical and Applied Informatics,
+Polish Academy of Sciences, Gliwice, Poland;
+*FMS UMS* - Faculty of Medical Sciences in Zabrze,
+Medical University of Silesia, Tarnowskie Góry, Poland;
+*PDMH* - Psychiatric Department of the Multidisciplinary Hospital,
+Tarnowskie Góry, Poland.
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+
+from utils_basic_plots import downsample_lttb
+from numpy.testing import assert_array_equal
+
+
+def lttb_with_loops(x, y, max_points):
+    """
+    Straightforward implementation of the Largest-Triangle-Three-Buckets
+    algorithm, used as a reference for downsample_lttb().
+    """
+    length = len(x)
+    bucket_size = (length - 2) / (max_points - 2)
+    indices = [0]
+    selected = 0
+    for bucket in range(max_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        next_x = sum(x[end:next_end]) / (next_end - end)
+        next_y = sum(y[end:next_end]) / (next_end - end)
+        max_area = -1
+        for i in range(start, end):
+            area = abs((x[selected] - next_x) * (y[i] - y[selected]) -
+                       (x[selected] - x[i]) * (next_y - y[selected]))
+            if area > max_area:
+                max_area = area
+                candidate = i
+        selected = candidate
+        indices.append(selected)
+    indices.append(length - 1)
+    return np.array(indices)
+
+
+class Test(unittest.TestCase):
+    def test_downsample_lttb(self):
+        rng = np.random.default_rng(0)
+        for length, max_points in [(10, 4), (101, 10), (1000, 37),
+                                   (5000, 400), (50, 49)]:
+            x = np.cumsum(rng.uniform(0.5, 1.5, size=length))
+            y = rng.normal(800, 50, size=length)
+            output_indices = downsample_lttb(x, y, max_points)
+            self.assertEqual(output_indices.shape[0], max_points)
+            self.assertEqual(output_indices[0], 0)
+            self.assertEqual(output_indices[-1], length - 1)
+            self.assertTrue(np.all(np.diff(output_indices) > 0))
+            self.assertIsNone(assert_array_equal(
+                lttb_with_loops(x - x[0], y, max_points), output_indices))
+
+        # Timestamps give the same selection as their numeric values
+        timestamps = pd.Timestamp('2022-05-10 12:00:00') + \
+            pd.to_timedelta(np.cumsum(rng.integers(500, 1500, size=300)),
+                            unit='ms')
+        y = rng.normal(800, 50, size=300)
+        x = timestamps.values.view('i8')
+        self.assertIsNone(assert_array_equal(
+            lttb_with_loops((x - x[0]).astype(np.float64), y, 30),
+            downsample_lttb(timestamps.values, y, 30)))
+
+        # Nothing to downsample
+        x = np.arange(20.)
+        for max_points in [None, 2, 20, 25]:
+            self.assertIsNone(assert_array_equal(
+                np.arange(20), downsample_lttb(x, x, max_points)))
+
+
+if __name__ == "__main__":
+    print('Run tests from the external path.')
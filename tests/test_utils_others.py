@@ -0,0 +1,109 @@
+"""
+Copyright 2023-2024
+Institute of Theoretical and Applied Informatics,
+Polish Academy of Sciences (ITAI PAS) https://www.iitis.pl
+
+The main author of the code:
+- Kamil Książek (ITAI PAS, ORCID ID: 0000-0002-0201-6220).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+---
+Polar HRV Data Analysis Library (PDAL) v 1.1
+---
+
+A source code to the paper:
+
+The analysis of heart rate variability and accelerometer mobility data
+in the assessment of symptom severity in psychosis disorder patients
+using a wearable Polar H10 sensor
+
+Authors:
+- Kamil Książek (ITAI PAS, ORCID ID: 0000-0002-0201-6220),
+- Wilhelm Masarczyk (FMS MUS, ORCID ID: 0000-0001-9516-0709),
+- Przemysław Głomb (ITAI PAS, ORCID ID: 0000-0002-0215-4674),
+- Michał Romaszewski (ITAI PAS, ORCID ID: 0000-0002-8227-929X),
+- Iga Stokłosa (FMS UMS, ORCID ID: 0000-0002-7283-5491),
+- Piotr Ścisło (PDMH, ORCID ID: 0000-0003-1213-2935),
+- Paweł Dębski (FMS UMS, ORCID ID: 0000-0001-5904-6407),
+- Robert Pudlo (FMS UMS, ORCID ID: 0000-0002-5748-0063),
+- Piotr Gorczyca (FMS UMS, ORCID ID: 0000-0002-9419-7988),
+- Magdalena Piegza (FMS UMS, ORCID ID: 0000-0002-8009-7118).
+
+*ITAI PAS* - Institute of Theoretical and Applied Informatics,
+Polish Academy of Sciences, Gliwice, Poland;
+*FMS UMS* - Faculty of Medical Sciences in Zabrze,
+Medical University of Silesia, Tarnowskie Góry, Poland;
+*PDMH* - Psychiatric Department of the Multidisciplinary Hospital,
+Tarnowskie Góry, Poland.
+"""
+
+import os
+import unittest
+import tempfile
+import pandas as pd
+import numpy as np
+
+from utils_others import (
+    compare_means_and_variances_in_groups,
+    compare_means_and_variances_in_groups_batch,
+    run_tests_parallel
+)
+from numpy.testing import assert_almost_equal
+
+
+class Test(unittest.TestCase):
+    def test_statistical_tests_for_several_HRV_methods(self):
+        rng = np.random.default_rng(0)
+        HRV_methods = ['RMSSD', 'SDNN', 'pNN50']
+        processed_data = pd.DataFrame({
+            'group': ['treatment'] * 12 + ['control'] * 9
+        })
+        for i, HRV_method in enumerate(HRV_methods):
+            processed_data[f'HRV_{HRV_method}'] = \
+                rng.normal(20 + i, 5 + i, size=processed_data.shape[0])
+
+        with tempfile.TemporaryDirectory() as saving_folder:
+            gt_results = {
+                HRV_method: compare_means_and_variances_in_groups(
+                    processed_data, saving_folder, HRV_method=HRV_method)
+                for HRV_method in HRV_methods
+            }
+            batch_results = compare_means_and_variances_in_groups_batch(
+                processed_data, HRV_methods, saving_folder)
+            parallel_results = run_tests_parallel(
+                processed_data, HRV_methods, saving_folder, max_workers=2)
+            for results in [batch_results, parallel_results]:
+                self.assertEqual(list(results.keys()), HRV_methods)
+                for HRV_method in HRV_methods:
+                    for name, value in gt_results[HRV_method].items():
+                        assert_almost_equal(results[HRV_method][name], value)
+
+            # Each file has a single layout of columns (the header
+            # is repeated before results of every call)
+            single_method_results = pd.read_csv(
+                os.path.join(saving_folder, 'statistical_tests_results.csv'),
+                delimiter=';', header=None)
+            several_methods_results = pd.read_csv(
+                os.path.join(saving_folder,
+                             'statistical_tests_results_HRV_methods.csv'),
+                delimiter=';', header=None)
+        self.assertEqual(single_method_results.shape, (6, 8))
+        self.assertEqual(several_methods_results.shape, (8, 9))
+        self.assertEqual(list(several_methods_results[0]),
+                         (['method'] + HRV_methods) * 2)
+
+
+if __name__ == "__main__":
+    print('Run tests from the external path.')
@@ -62,13 +62,17 @@ from numpy.testing import (
 from utils_preprocessing import (
     convert_absolute_time_to_timestamps_from_given_timestamp,
     interpolate_data_with_splines,
+    mask_of_time_ranges,
+    merge_time_ranges,
     remove_preceding_and_following_beat,
     remove_consecutive_beats_after_holes,
     remove_adjacent_beats,
     remove_first_and_last_indices,
+    remove_manually_anomalies,
     remove_negative_timestamps,
     remove_selected_time_ranges,
-    return_hour_from_datetime
+    return_hour_from_datetime,
+    return_hours_from_datetimes
 )
 
 
@@ -232,6 +236,18 @@ class Test(unittest.TestCase):
             assert_frame_equal(gt_dataframe, output_dataframe)
         )
 
+        # Unittest 3) timestamps stored with a resolution of seconds
+        input_dataframe['Phone timestamp'] = \
+            input_dataframe['Phone timestamp'].astype('datetime64[s]')
+        gt_dataframe['Phone timestamp'] = \
+            gt_dataframe['Phone timestamp'].astype('datetime64[s]')
+        output_dataframe = remove_adjacent_beats(
+            input_dataframe, indices, time='5 seconds'
+        )
+        self.assertIsNone(
+            assert_frame_equal(gt_dataframe, output_dataframe)
+        )
+
 
     def test_remove_consecutive_beats_after_holes(self):
         # Unittest 1)
@@ -293,6 +309,20 @@ class Test(unittest.TestCase):
             assert_frame_equal(gt_dataframe, output_dataframe)
         )
 
+        # Unittest 3) timestamps stored with a resolution of milliseconds
+        input_dataframe['Phone timestamp'] = \
+            input_dataframe['Phone timestamp'].astype('datetime64[ms]')
+        gt_dataframe['Phone timestamp'] = \
+            gt_dataframe['Phone timestamp'].astype('datetime64[ms]')
+        output_dataframe = remove_consecutive_beats_after_holes(
+            input_dataframe,
+            hole_time='30 seconds',
+            window_time='15 seconds'
+        )
+        self.assertIsNone(
+            assert_frame_equal(gt_dataframe, output_dataframe)
+        )
+
     def test_remove_first_and_last_indices(self):
         # Unittest 1)
         data = {
@@ -472,6 +502,61 @@ class Test(unittest.TestCase):
             assert_frame_equal(gt_dataframe, output_dataframe)
         )
 
+    def test_merge_time_ranges(self):
+        # Unsorted, overlapping, adjacent and nested ranges
+        intervals = [(20, 25), (1, 5), (4, 8), (9, 10), (22, 23), (30, 30)]
+        self.assertEqual(merge_time_ranges(intervals),
+                         [(1, 10), (20, 25), (30, 30)])
+        self.assertEqual(merge_time_ranges([]), [])
+
+    def test_remove_manually_anomalies(self):
+        # Ranges are compared with the time of day, whatever the date
+        data = pd.DataFrame({
+            'Phone timestamp': pd.to_datetime([
+                '2022-05-10 12:43:30', '2022-05-10 12:43:40',
+                '2022-05-10 12:43:50', '2022-05-10 13:00:00',
+                '2022-05-10 13:37:30', '2022-05-10 13:37:45',
+                '2022-05-10 13:38:00', '2022-05-10 13:38:10',
+                '2022-05-10 14:00:00'
+            ]),
+            'RR-interval [ms]': [800, 810, 820, 830, 840, 850, 860, 870, 880]
+        })
+        output_dataframe = remove_manually_anomalies(data, 'treatment', 1)
+        gt_dataframe = data.iloc[[2, 3, 7, 8]]
+        self.assertIsNone(
+            assert_frame_equal(gt_dataframe, output_dataframe)
+        )
+        # Persons without manual annotations are left untouched
+        output_dataframe = remove_manually_anomalies(data, 'treatment', 4)
+        self.assertIsNone(assert_frame_equal(data, output_dataframe))
+        with self.assertRaises(ValueError):
+            remove_manually_anomalies(data, 'placebo', 1)
+
+    def test_mask_of_time_ranges(self):
+        timestamps = np.array([0, 5, 10, 15, 20, 25, 30, 35])
+        # Overlapping, unsorted and single-point ranges
+        starts = np.array([20, 5, 8, 35])
+        ends = np.array([22, 10, 15, 35])
+        output_mask = mask_of_time_ranges(timestamps, starts, ends)
+        gt_mask = np.array([False, True, True, True,
+                            True, False, False, True])
+        self.assertIsNone(assert_array_equal(gt_mask, output_mask))
+
+        # A range ending before its beginning removes nothing and does not
+        # affect other ranges
+        starts = np.array([30, 15])
+        ends = np.array([10, 40])
+        output_mask = mask_of_time_ranges(timestamps, starts, ends)
+        gt_mask = np.array([False, False, False, True,
+                            True, True, True, True])
+        self.assertIsNone(assert_array_equal(gt_mask, output_mask))
+
+        # No ranges at all
+        output_mask = mask_of_time_ranges(timestamps,
+                                          np.array([], dtype=np.int64),
+                                          np.array([], dtype=np.int64))
+        self.assertFalse(output_mask.any())
+
     def test_remove_selected_time_ranges(self):
         # Unittest 1)
         data = {
@@ -540,6 +625,18 @@ class Test(unittest.TestCase):
             assert_frame_equal(gt_dataframe, output_dataframe)
         )
 
+        # Unittest 3) timestamps stored with a resolution of milliseconds
+        input_dataframe['Phone timestamp'] = \
+            input_dataframe['Phone timestamp'].astype('datetime64[ms]')
+        gt_dataframe['Phone timestamp'] = \
+            gt_dataframe['Phone timestamp'].astype('datetime64[ms]')
+        output_dataframe = remove_selected_time_ranges(
+            input_dataframe, timeranges_to_remove
+        )
+        self.assertIsNone(
+            assert_frame_equal(gt_dataframe, output_dataframe)
+        )
+
     def test_return_hour_from_datetime(self):
         datetime_1 = pd.Timestamp('2022-11-05 05:30:51')
         output_datetime_1 = return_hour_from_datetime(datetime_1)
@@ -550,6 +647,16 @@ class Test(unittest.TestCase):
         gt_datetime_2 = '05:30:51.238'
         self.assertEqual(output_datetime_2, gt_datetime_2)
 
+    def test_return_hours_from_datetimes(self):
+        datetimes = pd.to_datetime([
+            '2022-11-05 05:30:51', '2022-11-05 23:59:59.999999',
+            '2022-11-06 00:00:00.000001', '2022-11-06 13:20:50.8'
+        ], format='ISO8601')
+        output_hours = return_hours_from_datetimes(datetimes.values)
+        gt_hours = [return_hour_from_datetime(datetime)
+                    for datetime in datetimes]
+        self.assertIsNone(assert_array_equal(gt_hours, output_hours))
+
     def test_interpolate_data_with_splines(self):
         def spline_function_for_testing(x):
             # Source: https://people.clas.ufl.edu/kees/files/CubicSplines.pdf
@@ -59,11 +59,41 @@ from scipy.stats import pearsonr
 from matplotlib.dates import DateFormatter, MinuteLocator
 
 from utils_others import (
-    append_row_to_file,
+    GROUPS_DTYPE,
+    append_rows_to_file,
     compare_means_and_variances_in_groups,
     filter_accelerometer_outlier_data
 )
 
+# Long signals are drawn in chunks by the Agg renderer and PNG files
+# are saved with a lower (faster) compression level
+plt.rcParams['agg.path.chunksize'] = 10000
+PNG_COMPRESSION = {'compress_level': 3}
+
+# Tick format and spacing of all time-series plots. Tickers keep a reference
+# to their axis, so a new formatter and locator is created for each axis.
+_HMS_FMT = "%H:%M:%S"
+_TICK_INTERVAL_MINUTES = 5
+
+# Labels for plots of given data types (used only for reading)
+_LABELS = {
+    'rr_intervals': {
+        'x_data': 'Phone timestamp',
+        'y_data': 'RR-interval [ms]',
+        'x_label': 'Timestamp',
+        'y_label': 'RR interval [ms]',
+        'title': 'Plot of RR intervals (milliseconds) depending on time'
+    },
+    'accelerometer': {
+        'x_data': 'X [mg]',
+        'y_data': 'Y [mg]',
+        'z_data': 'Z [mg]',
+        'x_label': 'Timestamp',
+        'time': 'Phone timestamp',
+        'title': 'Values of accelerometer depending on time'
+    }
+}
+
 
 def prepare_labels(name):
     """
@@ -79,25 +109,9 @@ def prepare_labels(name):
        (X, Y for RR intervals and X, Y, Z for accelerometer data) and title
        for plots.
     """
-    if name == 'rr_intervals':
-        return {
-            'x_data': 'Phone timestamp',
-            'y_data': 'RR-interval [ms]',
-            'x_label': 'Timestamp',
-            'y_label': 'RR interval [ms]',
-            'title': 'Plot of RR intervals (milliseconds) depending on time'
-        }
-
-    elif name == 'accelerometer':
-        return {
-            'x_data': 'X [mg]',
-            'y_data': 'Y [mg]',
-            'z_data': 'Z [mg]',
-            'x_label': 'Timestamp',
-            'time': 'Phone timestamp',
-            'title': 'Values of accelerometer depending on time'
-        }
-    else:
+    try:
+        return _LABELS[name]
+    except KeyError:
         raise ValueError('Wrong type of the analyzed data!')
 
 
@@ -114,14 +128,13 @@ def change_plot_range(ranges):
       -left- defines the lowest value to plot on x-axis
       -right- defines the largest value to plot on x-axis
     """
-    if 'bottom' in ranges and ranges['bottom'] is not None:
-        plt.ylim(bottom=ranges['bottom'])
-    if 'top' in ranges and ranges['top'] is not None:
-        plt.ylim(top=ranges['top'])
-    if 'left' in ranges and ranges['left'] is not None:
-        plt.xlim(left=ranges['left'])
-    if 'right' in ranges and ranges['right'] is not None:
-        plt.xlim(right=ranges['right'])
+    # None leaves the given limit unchanged
+    bottom, top = ranges.get('bottom'), ranges.get('top')
+    left, right = ranges.get('left'), ranges.get('right')
+    if bottom is not None or top is not None:
+        plt.ylim(bottom=bottom, top=top)
+    if left is not None or right is not None:
+        plt.xlim(left=left, right=right)
 
 
 def display_p_values(p_value):
@@ -165,6 +178,58 @@ def plot_anomalies(ax,
                    color='skyblue')
 
 
+def downsample_lttb(x, y, max_points):
+    """
+    Select points of a signal with the Largest-Triangle-Three-Buckets
+    algorithm, so that the shape of a long signal is preserved
+    on the plot using at most *max_points* points.
+
+    Arguments:
+    ----------
+      *x*: (Numpy array) x coordinates (numbers or datetime64)
+      *y*: (Numpy array) y coordinates
+      *max_points*: (int or None) the maximal number of points;
+                    None means no downsampling
+
+    Returns:
+    --------
+      *indices*: (Numpy array) sorted indices of the selected points
+    """
+    length = len(x)
+    if max_points is None or max_points < 3 or length <= max_points:
+        return np.arange(length)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.view('i8')
+    # Shift x to keep the precision of large timestamps in floats
+    x = (x - x[0]).astype(np.float64)
+    y = y.astype(np.float64)
+
+    # The first and the last point are always kept, the remaining ones
+    # are divided into buckets, one point selected from each bucket
+    bucket_size = (length - 2) / (max_points - 2)
+    edges = (np.arange(max_points - 1) * bucket_size).astype(np.int64) + 1
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    # The third vertex of the triangle is the mean of the next bucket
+    # (for the last bucket - the last point)
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0], indices[-1] = 0, length - 1
+    selected = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        areas = np.abs(
+            (x[selected] - next_x[bucket]) * (y[start:end] - y[selected]) -
+            (x[selected] - x[start:end]) * (next_y[bucket] - y[selected])
+        )
+        selected = start + np.argmax(areas)
+        indices[bucket + 1] = selected
+    return indices
+
+
 def plot_1D_signal(data,
                    data_type,
                    column_name=None,
@@ -176,7 +241,9 @@ def plot_1D_signal(data,
                    },
                    anomalies=None,
                    saving_folder=None,
-                   name=None):
+                   name=None,
+                   dpi=200,
+                   max_points=4000):
     """
     Plot one-dimensional signal, e.g. RR-intervals.
 
@@ -189,35 +256,35 @@ def plot_1D_signal(data,
       *anomalies* (list or Numpy array) optional anomalies for plot
       *saving_folder* (string) optional, custom folder for saving
       *name* (string) optional, custom filename for saving
+      *dpi* (int) optional, resolution of the saved PNG file
+      *max_points* (int or None) optional, long signals are downsampled
+                   to this number of points before plotting
     """
     sns.set_style("whitegrid")
-    fig, ax = plt.subplots()
+    fig, ax = plt.subplots(layout='constrained')
     labels = prepare_labels(data_type)
     if anomalies is not None:
         plot_anomalies(ax, data, anomalies)
     if len(column_name) == 2:
-        modified_data = pd.melt(
-            data,
-            id_vars="Phone timestamp",
-            value_vars=column_name,
-            var_name='processing_type',
-            value_name='value'
-        )
-        plot = sns.lineplot(
-            data=modified_data,
-            x='Phone timestamp',
-            y='value',
-            hue='processing_type',
-            lw=1,
-            palette=['red', 'blue'],
-            dashes=False)
-        plot.legend().set_title(None)
+        # Both columns are drawn separately on the same axes
+        for column, color in zip(column_name, ['red', 'blue']):
+            indices = downsample_lttb(data['Phone timestamp'].values,
+                                      data[column].values,
+                                      max_points)
+            ax.plot(data['Phone timestamp'].values[indices],
+                    data[column].values[indices],
+                    lw=1,
+                    color=color,
+                    label=column)
+        ax.legend(title=None)
     elif len(column_name) == 1:
-        sns.lineplot(data=data,
-                     x='Phone timestamp',
-                     y=column_name[0],
-                     lw=1,
-                     color='red')
+        indices = downsample_lttb(data['Phone timestamp'].values,
+                                  data[column_name[0]].values,
+                                  max_points)
+        ax.plot(data['Phone timestamp'].values[indices],
+                data[column_name[0]].values[indices],
+                lw=1,
+                color='red')
     else:
         raise NotImplementedError
     plt.xlabel(labels['x_label'])
@@ -226,20 +293,17 @@ def plot_1D_signal(data,
 
     # If it is desired, change plot ranges.
     change_plot_range(ranges)
-    myFmt = DateFormatter("%H:%M:%S")
-    myLct = MinuteLocator(interval=5)
-    ax.xaxis.set_major_formatter(myFmt)
-    ax.xaxis.set_major_locator(myLct)
+    ax.xaxis.set_major_formatter(DateFormatter(_HMS_FMT))
+    ax.xaxis.set_major_locator(MinuteLocator(interval=_TICK_INTERVAL_MINUTES))
     if labels['x_label'] == 'Timestamp':
         plt.xticks(rotation=90, fontsize=8)
-    plt.tight_layout()
     if name is None:
         timestamp = data.iloc[0]['Phone timestamp'].strftime('%Y-%m-%d_%H%M%S')
         name = f'{data_type}_plot_{timestamp}.png'
     if saving_folder is not None:
         os.makedirs(saving_folder, exist_ok=True)
         name = f'{saving_folder}/{name}'
-    plt.savefig(name, dpi=400)
+    plt.savefig(name, dpi=dpi, pil_kwargs=PNG_COMPRESSION)
     plt.close()
 
 
@@ -269,17 +333,17 @@ def plot_column_of_values_for_given_person(dataframe,
                         for saving the plot
     """
     sns.set_style("whitegrid")
-    fig, ax = plt.subplots()
-    sns.lineplot(data=dataframe,
-                 x="Phone timestamp",
-                 y=column)
-    myFmt = DateFormatter("%H:%M:%S")
-    ax.xaxis.set_major_formatter(myFmt)
+    fig, ax = plt.subplots(layout='constrained')
+    ax.plot(dataframe["Phone timestamp"].values,
+            dataframe[column].values,
+            rasterized=True)
+    ax.set_xlabel("Phone timestamp")
+    ax.set_ylabel(column)
+    ax.xaxis.set_major_formatter(DateFormatter(_HMS_FMT))
     plt.title(f'{group}: {number}, interval: {interval}')
     plt.xticks(rotation=90)
     column = column.replace(' ', '_').replace('/', '_')
     name = f'{column}_{group}_{number}_{interval}'
-    plt.tight_layout()
     plt.savefig(f'{saving_folder}/{name}.pdf', dpi=300)
     plt.close()
 
@@ -319,27 +383,31 @@ def regression_PANSS(dataframe,
               'PANSS negative scale',
               'PANSS general scale',
               'PANSS total result']
-    for column, label in zip(columns, labels):
-        correlation_result = pearsonr(
-            x=dataframe[HRV_columnname],
-            y=dataframe[column],
-            alternative=alternative
+    # Correlations for all PANSS columns are calculated at once
+    correlation_result = pearsonr(
+        x=dataframe[HRV_columnname].to_numpy(np.float64)[:, np.newaxis],
+        y=dataframe[columns].to_numpy(np.float64),
+        alternative=alternative,
+        axis=0
+    )
+    confidence_intervals = correlation_result.confidence_interval()
+    # Rows are collected and saved to the file after the loop
+    path = f"{parameters['plot_saving_folder']}/results.csv"
+    rows = []
+    if not os.path.exists(path):
+        rows.append(
+            "step;window_size;category;correlation;pvalue;CI_start;CI_end"
         )
-        statistic, pvalue = correlation_result[0], correlation_result[1]
-        confidence_interval = correlation_result.confidence_interval()
-        # Save results to the file
-        path = f"{parameters['plot_saving_folder']}/results.csv"
-        if not os.path.exists(path):
-            append_row_to_file(
-                path,
-                "step;window_size;category;correlation;pvalue;CI_start;CI_end"
-            )
-        append_row_to_file(
-            path,
-            (f"{parameters['step_frequency'].total_seconds() / 60};"
-             f"{parameters['window_size'].total_seconds() / 60};"
-             f"{column};{statistic};{pvalue};"
-             f"{confidence_interval[0]};{confidence_interval[1]}")
+    for i, (column, label) in enumerate(zip(columns, labels)):
+        statistic = correlation_result.statistic[i]
+        pvalue = correlation_result.pvalue[i]
+        confidence_interval = (confidence_intervals.low[i],
+                               confidence_intervals.high[i])
+        rows.append(
+            f"{parameters['step_frequency'].total_seconds() / 60};"
+            f"{parameters['window_size'].total_seconds() / 60};"
+            f"{column};{statistic};{pvalue};"
+            f"{confidence_interval[0]};{confidence_interval[1]}"
         )
         sns.regplot(data=dataframe,
                     x=HRV_columnname,
@@ -363,6 +431,7 @@ def regression_PANSS(dataframe,
         plt.savefig(f"{parameters['plot_saving_folder']}/HRV_{column}.pdf",
                     dpi=300)
         plt.close()
+    append_rows_to_file(path, rows)
 
 
 def boxplot(dataframe,
@@ -445,11 +514,14 @@ def plot_distribution_PANSS_subcategories(load_folder,
         'PANSS_G': 'PANSS general',
         'PANSS_total': 'PANSS total'
     }, inplace=True)
-    reordered_PANSS = pd.melt(
-        PANSS_summary,
-        id_vars=['no_of_person'],
-        value_vars=['PANSS positive', 'PANSS negative',
-                    'PANSS general', 'PANSS total'])
+    reordered_PANSS = (
+        PANSS_summary.set_index('no_of_person')[
+            ['PANSS positive', 'PANSS negative',
+             'PANSS general', 'PANSS total']]
+        .stack(dropna=False)
+        .rename_axis(['no_of_person', 'variable'])
+        .reset_index(name='value')
+    )
     sns.boxplot(x=reordered_PANSS["value"], y=reordered_PANSS["variable"],
                 linewidth=1.)
     if save_folder is not None:
@@ -463,7 +535,10 @@ def plot_distribution_PANSS_subcategories(load_folder,
 
 def plot_accelerometer_data(data,
                             saving_folder=None,
-                            name=''):
+                            name='',
+                            dpi=200,
+                            max_points=4000,
+                            fig=None):
     """
     Plot accelerometer data (three plots, each image represents
     one of three dimensions).
@@ -477,10 +552,21 @@ def plot_accelerometer_data(data,
                        will be saved, by default it is a current folder
      *name* - (optional str) defines an additional string located
               in the plot filename
+     *dpi* - (optional int) defines the resolution of the saved PNG file
+     *max_points* - (optional int or None) defines the number of points
+                    to which each signal is downsampled before plotting
+     *fig* - (optional Matplotlib Figure) a figure with three axes reused
+             between consecutive calls (see create_accelerometer_figure);
+             it is cleared before plotting and it is not closed
     """
-    sns.set_style("whitegrid")
-    fig, (ax_x, ax_y, ax_z) = plt.subplots(nrows=3,
-                                           sharex=True)
+    if fig is None:
+        close_figure = True
+        fig = create_accelerometer_figure()
+    else:
+        close_figure = False
+        for ax in fig.axes:
+            ax.cla()
+    ax_x, ax_y, ax_z = fig.axes
     axes = {
         'x': ax_x,
         'y': ax_y,
@@ -488,28 +574,46 @@ def plot_accelerometer_data(data,
     }
     labels = prepare_labels('accelerometer')
     for axis in list(axes.keys()):
-        sns.lineplot(data=data,
-                     x=labels['time'],
-                     y=labels[f'{axis}_data'],
-                     ax=axes[axis],
-                     lw=1,
-                     ci=None,
-                     color='red')
-    myFmt = DateFormatter("%H:%M:%S")
-    axes[axis].xaxis.set_major_formatter(myFmt)
+        indices = downsample_lttb(data[labels['time']].values,
+                                  data[labels[f'{axis}_data']].values,
+                                  max_points)
+        axes[axis].plot(data[labels['time']].values[indices],
+                        data[labels[f'{axis}_data']].values[indices],
+                        lw=1,
+                        color='red')
+        axes[axis].set_ylabel(labels[f'{axis}_data'])
+    # Subplots share the time axis, so only the bottom one is labelled
+    ax_z.set_xlabel(labels['time'])
+    axes[axis].xaxis.set_major_formatter(DateFormatter(_HMS_FMT))
     # One legend above all plots
     fig.suptitle(labels['title'])
 
-    plt.xticks(rotation=90)
-    plt.tight_layout()
+    ax_z.tick_params(axis='x', labelrotation=90)
     if len(name) == 0:
         name = data.iloc[0]['Phone timestamp'].strftime('%Y-%m-%d_%H%M%S')
     fullname = f'ACC_plot_{name}.png'
     if saving_folder is not None:
         os.makedirs(saving_folder, exist_ok=True)
         fullname = f'{saving_folder}{fullname}'
-    plt.savefig(fullname, dpi=600)
-    plt.close()
+    fig.savefig(fullname, dpi=dpi, pil_kwargs=PNG_COMPRESSION)
+    if close_figure:
+        plt.close(fig)
+
+
+def create_accelerometer_figure():
+    """
+    Create a figure with three axes (sharing the x-axis) for plotting
+    accelerometer data. It may be reused in plot_accelerometer_data.
+
+    Returns:
+    --------
+     *fig* - Matplotlib Figure
+    """
+    sns.set_style("whitegrid")
+    fig, _ = plt.subplots(nrows=3,
+                          sharex=True,
+                          layout='constrained')
+    return fig
 
 
 def age_histograms(age_patients,
@@ -571,8 +675,8 @@ if __name__ == "__main__":
         ACC_categories[category] = ACC_values.loc[
             ACC_values['key'].str.contains(category)]['ACC_mean'].values
 
-    ACC_values['key'] = ACC_values['key'].str.replace(r'(_)\d+', '',
-                                                      regex=True)
+    ACC_values['key'] = ACC_values['key'].str.replace(
+        r'(_)\d+', '', regex=True).astype(GROUPS_DTYPE)
     filtered_ACC_values = filter_accelerometer_outlier_data(ACC_values)
 
     statistical_tests_results = compare_means_and_variances_in_groups(
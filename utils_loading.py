@@ -49,11 +49,17 @@ Medical University of Silesia, Tarnowskie Góry, Poland;
 Tarnowskie Góry, Poland.
 """
 
+import os
+import json
 import pickle
+import hashlib
+import matplotlib
 import pandas as pd
 import numpy as np
 from typing import List
+from functools import lru_cache
 from retry import retry
+from concurrent.futures import ProcessPoolExecutor
 
 from utils_preprocessing import (
     convert_absolute_time_to_timestamps_from_given_timestamp,
@@ -64,12 +70,19 @@ from utils_preprocessing import (
     remove_manually_anomalies,
     remove_negative_timestamps,
     select_indices_to_filtering,
+    MANUAL_ANOMALIES_FILE,
 )
+from utils_others import GROUPS_DTYPE
 from utils_basic_plots import (
+    create_accelerometer_figure,
     plot_1D_signal,
     plot_accelerometer_data
 )
 
+# Part of the key of cached preprocessed data. Increase it after every
+# change of the preprocessing steps, so that old cached files are not used.
+PREPROCESSING_VERSION = 1
+
 
 def load_data_for_single_person(main_folder,
                                 cur_person_group,
@@ -91,7 +104,9 @@ def load_data_for_single_person(main_folder,
     """
     data = load_dataframe(
         main_folder, cur_person_group, cur_person_number, datatype)
-    data["Phone timestamp"] = pd.to_datetime(data["Phone timestamp"])
+    # Timestamps are normally parsed already while reading the CSV file
+    if not pd.api.types.is_datetime64_any_dtype(data["Phone timestamp"]):
+        data["Phone timestamp"] = pd.to_datetime(data["Phone timestamp"])
     initial_timestamp = data.iloc[0]["Phone timestamp"]
     data = convert_absolute_time_to_timestamps_from_given_timestamp(
         data, initial_timestamp
@@ -134,6 +149,20 @@ def load_and_preprocess_data_for_single_person(parameters,
     abbrv = 'RR'
     main_folder = parameters["main_folder"]
 
+    # Reuse preprocessed data, if caching is enabled (plots are
+    # prepared only during the full preprocessing)
+    cache_path = None
+    if "preprocessing_cache_folder" in parameters and not plot:
+        cache_folder = parameters["preprocessing_cache_folder"]
+        key = preprocessing_cache_key(
+            parameters,
+            f'{main_folder}{cur_person_group}_{cur_person_number}.csv'
+        )
+        cache_path = (f'{cache_folder}/'
+                      f'{cur_person_group}_{cur_person_number}_{key}.pkl')
+        if os.path.exists(cache_path):
+            return pd.read_pickle(cache_path)
+
     # Load raw data for the selected person
     data = load_data_for_single_person(
         main_folder,
@@ -180,7 +209,9 @@ def load_and_preprocess_data_for_single_person(parameters,
         )
 
     if parameters['interpolation']:
-        data_before_DWT = data.copy()
+        # The following steps return new dataframes without modifying
+        # their input, so a reference is enough here
+        data_before_DWT = data
     # Remove neighbouring heart beats to the selected ones
     data = remove_adjacent_beats(
         data,
@@ -202,10 +233,54 @@ def load_and_preprocess_data_for_single_person(parameters,
             current_data=data,
             column_name=column_name
         )
+    if cache_path is not None:
+        os.makedirs(cache_folder, exist_ok=True)
+        data.to_pickle(cache_path)
     return data
 
 
-@retry((FileNotFoundError, IOError))
+def preprocessing_cache_key(parameters, source_path):
+    """
+    Prepare a short hash of everything affecting the preprocessing,
+    used in names of cached files: selected parameters, the version
+    of the preprocessing, the table of manual anomalies and the size
+    and modification time of the raw data file.
+
+    Arguments:
+    ----------
+      *parameters*: (dictionary) contains parameters of the preprocessing
+      *source_path*: (string) path to the CSV file with raw measurements
+
+    Returns:
+    --------
+      *key*: (string) hexadecimal hash of selected parameters
+    """
+    selected_parameters = {
+        name: parameters[name] for name in [
+            'main_folder',
+            'cut_time_from_start',
+            'cut_time_before_finish',
+            'threshold_for_hole_duration',
+            'time_after_hole_for_removing',
+            'adjacent_beats_for_removing',
+            'interpolation'
+        ]
+    }
+    selected_parameters['preprocessing_version'] = PREPROCESSING_VERSION
+    # A missing file is reported later, while loading the data
+    if os.path.exists(source_path):
+        source_stat = os.stat(source_path)
+        selected_parameters['source_file'] = [source_stat.st_size,
+                                              source_stat.st_mtime_ns]
+    serialized = json.dumps(selected_parameters,
+                            sort_keys=True,
+                            default=str)
+    key = hashlib.blake2b(serialized.encode(), digest_size=8)
+    with open(MANUAL_ANOMALIES_FILE, 'rb') as file:
+        key.update(file.read())
+    return key.hexdigest()
+
+
 def load_dataframe(folder, group, number, datatype):
     """
     Load Pandas dataframe according to the selected group
@@ -224,12 +299,34 @@ def load_dataframe(folder, group, number, datatype):
        *data*: Pandas dataframe with loaded data
     """
     if datatype not in ['RR', 'ACC']:
-        return ValueError(
+        raise ValueError(
             'Wrong type of data. Possible options: "ACC" or "RR".')
 
+    path = f'{folder}{group}_{number}.csv'
+    # A missing file is not a transient error, so it is not retried
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'File {path} does not exist!')
+    return read_csv_with_retry(path)
+
+
+@retry(IOError, tries=3, delay=0.2, backoff=2)
+def read_csv_with_retry(path):
+    """
+    Read a CSV file with measurements, retrying a few times
+    in the case of input/output errors.
+
+    Arguments:
+    ----------
+       *path*: (string) path to the CSV file
+
+    Returns:
+    --------
+       *data*: Pandas dataframe with loaded data
+    """
     data = pd.read_csv(
-        f'{folder}{group}_{number}.csv',
-        delimiter=';'
+        path,
+        delimiter=';',
+        parse_dates=['Phone timestamp']
     )
     return data
 
@@ -288,12 +385,17 @@ def create_dataframe_from_HRV_results_different_methods(
         )
     else:
         raise ValueError('Wrong shape of the table with results!')
+    # Only two groups and small numbers of persons are stored
+    dataframe['group'] = dataframe['group'].astype(GROUPS_DTYPE)
+    dataframe['no_of_person'] = dataframe['no_of_person'].astype(np.int32)
     return dataframe
 
 
 def load_results_file(fname):
     """
-    Load a pickle file.
+    Load a pickle file (the pickle protocol is detected
+    automatically, so files saved with the highest protocol
+    are also supported).
 
     Argument:
     ---------
@@ -305,13 +407,53 @@ def load_results_file(fname):
         return pickle.load(fobj)
 
 
+@lru_cache(maxsize=None)
+def shared_accelerometer_figure():
+    """
+    Return a figure for accelerometer plots, created once per process
+    and reused for consecutive persons.
+    """
+    return create_accelerometer_figure()
+
+
+def plot_accelerometer_data_for_single_person(main_folder,
+                                              group,
+                                              person,
+                                              saving_folder):
+    """
+    Load accelerometer data for a selected person and save its plot.
+
+    Arguments:
+    ----------
+      *main_folder*: (string) folder with experiment's files
+      *group*: (string) 'treatment' or 'control'
+      *person*: (int) number of the selected person
+      *saving_folder*: (string) folder where the plot will be saved
+    """
+    data = load_data_for_single_person(
+        main_folder,
+        group,
+        person,
+        'ACC'
+    )
+    plot_accelerometer_data(
+        data,
+        saving_folder,
+        name=f'{group}_{person}',
+        fig=shared_accelerometer_figure()
+    )
+
+
 if __name__ == "__main__":
+    # Plots are only saved to files, so workers do not need a GUI backend
+    matplotlib.use('Agg')
     main_folder = (
         '/data/anonimized_accelerometer_data/'
     )
 
     # Plot accelerometer data
     folder_for_ACC_plots = '../Plots/raw_accelerometer_data/'
+    tasks = []
     for group in ['control', 'treatment']:
         for person in range(1, 49):
             if (group == 'treatment' and (
@@ -323,14 +465,19 @@ if __name__ == "__main__":
                            12, 13, 14, 15, 17, 23, 27, 48])):
                 continue
             else:
-                data = load_data_for_single_person(
-                    main_folder,
-                    group,
-                    person,
-                    'ACC'
-                )
-                plot_accelerometer_data(
-                    data,
-                    folder_for_ACC_plots,
-                    name=f'{group}_{person}'
-                )
+                tasks.append((group, person))
+
+    # Every person is loaded and plotted independently
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                plot_accelerometer_data_for_single_person,
+                main_folder,
+                group,
+                person,
+                folder_for_ACC_plots
+            )
+            for group, person in tasks
+        ]
+        for future in futures:
+            future.result()
@@ -49,14 +49,49 @@ Medical University of Silesia, Tarnowskie Góry, Poland;
 Tarnowskie Góry, Poland.
 """
 
+import csv
 import numpy as np
 import pandas as pd
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from scipy.stats import (
     levene,
     mannwhitneyu
 )
 
 
+@contextmanager
+def open_csv_appender(filename):
+    '''
+    Open the given file once for appending consecutive rows.
+
+    Parameters
+    ----------
+    filename: folder and name of file
+    '''
+    if not filename.endswith('.csv'):
+        filename += '.csv'
+    with open(filename, "a", newline='', encoding='utf-8',
+              buffering=1 << 20) as stream:
+        yield stream
+
+
+def append_row_to_stream(stream,
+                         elements):
+    '''
+    Append a single row to the file opened with open_csv_appender.
+
+    Parameters
+    ----------
+    stream: opened file
+    elements: a string with elements separated by ';'
+              or an iterable with elements of the row
+    '''
+    if not isinstance(elements, str):
+        elements = ';'.join(map(str, elements))
+    stream.write(f'{elements}\n')
+
+
 def append_row_to_file(filename,
                        elements):
     '''
@@ -67,13 +102,23 @@ def append_row_to_file(filename,
     filename: folder and name of file
     elements: elements to saving in filename
     '''
-    if not filename.endswith('.csv'):
-        filename += '.csv'
-    with open(filename, "a+") as stream:
-        np.savetxt(stream,
-                   np.array(elements)[np.newaxis],
-                   delimiter=';',
-                   fmt='%s')
+    with open_csv_appender(filename) as stream:
+        append_row_to_stream(stream, elements)
+
+
+def append_rows_to_file(filename,
+                        rows):
+    '''
+    Append several rows to the given file at once.
+
+    Parameters
+    ----------
+    filename: folder and name of file
+    rows: list of rows (strings with elements separated by ';')
+    '''
+    with open_csv_appender(filename) as stream:
+        for row in rows:
+            append_row_to_stream(stream, row)
 
 
 def filter_patients_with_quetiapine(list_of_quetiapine_patients,
@@ -97,19 +142,70 @@ def filter_patients_with_quetiapine(list_of_quetiapine_patients,
       *quetiapine_patients_results* - Pandas Dataframe containing patients taking
                                       quetiapine
     """
-    quetiapine_patients_results = treatment_results.loc[
-        treatment_results['no_of_person'].isin(list_of_quetiapine_patients)
-    ].copy()
-    treatment_results = treatment_results.drop(
-        quetiapine_patients_results.index.values)
+    mask = np.isin(treatment_results['no_of_person'].to_numpy(),
+                   np.asarray(list_of_quetiapine_patients))
+    quetiapine_patients_results = treatment_results.loc[mask].copy()
+    treatment_results = treatment_results.loc[~mask].copy()
     return treatment_results, quetiapine_patients_results
 
 
+# Categorical type of columns with names of groups ('group' or 'key')
+GROUPS_DTYPE = pd.CategoricalDtype(['control', 'treatment'])
+
+STATISTICAL_TESTS_HEADER = (
+    'Mann-Whitney U-test statistic', 'p-value',
+    "Levene's test statistic", 'p-value',
+    'median_treatment', 'std_treatment',
+    'median_control', 'std_control'
+)
+
+
+def medians_and_stds(values):
+    """
+    Calculate medians and standard deviations along the last axis.
+
+    Parameters:
+    ----------
+      *values*: (Numpy array) one-dimensional array or a two-dimensional
+                array with one set of values in each row
+
+    Returns:
+    --------
+      *medians*: (float / Numpy array) median of each set of values
+      *stds*: (float / Numpy array) standard deviation of each set of values
+    """
+    return np.median(values, axis=-1), np.std(values, axis=-1)
+
+
+def get_group_indices(dataframe, group_column='group'):
+    """
+    Find positions of rows from the control and the treatment group.
+
+    Parameters:
+    ----------
+      *dataframe*: (Pandas Dataframe) contains a column with names
+                   of groups
+      *group_column*: (string) the name of this column, 'group'
+                      (default) or 'key'
+
+    Returns:
+    --------
+      *control_indices*: (Numpy array) positions of the control group rows
+      *treatment_indices*: (Numpy array) positions of the treatment
+                           group rows
+    """
+    # For the categorical column (GROUPS_DTYPE) integer codes are compared
+    groups = dataframe[group_column]
+    return (np.flatnonzero((groups == 'control').to_numpy()),
+            np.flatnonzero((groups == 'treatment').to_numpy()))
+
+
 def compare_means_and_variances_in_groups(
         processed_data,
         saving_folder,
         HRV_method=None,
-        ACC_method=None):
+        ACC_method=None,
+        group_indices=None):
     """
     Prepare a non-parametric version of the statistical test
     comparing mean HRV or accelerometer values between the treatment
@@ -129,6 +225,10 @@ def compare_means_and_variances_in_groups(
                     for calculation of the HRV value, by default: None
       *ACC_method*: (string) represents the name of the method used
                     for calculation of the ACC values, by default: None
+      *group_indices*: (tuple of Numpy arrays) optional positions of rows
+                       from the control and the treatment group, as returned
+                       by get_group_indices(); useful when the function
+                       is called many times for the same dataframe
 
     Returns:
     --------
@@ -141,16 +241,16 @@ def compare_means_and_variances_in_groups(
     assert (HRV_method is not None and ACC_method is None) \
         or (HRV_method is None and ACC_method is not None)
     if HRV_method is not None:
-        processed_data_HRV = processed_data[['group', f'HRV_{HRV_method}']]
-        control_values = processed_data_HRV[
-            processed_data_HRV['group'] == 'control'][f'HRV_{HRV_method}'].values
-        treatment_values = processed_data_HRV[
-            processed_data_HRV['group'] == 'treatment'][f'HRV_{HRV_method}'].values
+        group_column = 'group'
+        values = processed_data[f'HRV_{HRV_method}'].to_numpy(np.float64)
     elif ACC_method is not None:
-        control_values = processed_data.loc[
-            processed_data['key'] == 'control'][ACC_method].values
-        treatment_values = processed_data.loc[
-            processed_data['key'] == 'treatment'][ACC_method].values
+        group_column = 'key'
+        values = processed_data[ACC_method].to_numpy(np.float64)
+    if group_indices is None:
+        group_indices = get_group_indices(processed_data, group_column)
+    control_indices, treatment_indices = group_indices
+    control_values = values[control_indices]
+    treatment_values = values[treatment_indices]
 
     # We test the hypothesis that HRV / accelerometer values within
     # the treatment group is statistically significantly lower than
@@ -168,17 +268,19 @@ def compare_means_and_variances_in_groups(
           f'with p-value: {u_test_p_value} \n')
     print(f"Result of the Levene\'s test: \n statistic: {levene_statistic}"
           f'with p-value: {levene_p_value}')
+    treatment_median, treatment_std = medians_and_stds(treatment_values)
+    control_median, control_std = medians_and_stds(control_values)
     path = f'{saving_folder}/statistical_tests_results.csv'
-    append_row_to_file(path,
-                       ('Mann-Whitney U-test statistic;p-value;'
-                        "Levene\'s test statistic;p-value;"
-                        'median_treatment;std_treatment;'
-                        'median_control;std_control'))
-    append_row_to_file(path,
-                       (f'{u_test_statistic};{u_test_p_value};'
-                        f'{levene_statistic};{levene_p_value};'
-                        f'{np.median(treatment_values)};{np.std(treatment_values)};'
-                        f'{np.median(control_values)};{np.std(control_values)}'))
+    with open_csv_appender(path) as stream:
+        writer = csv.writer(stream, delimiter=';', lineterminator='\n')
+        writer.writerow(STATISTICAL_TESTS_HEADER)
+        # Numpy scalars are converted to floats to keep their plain
+        # representation in the file
+        writer.writerow(tuple(map(float, (
+            u_test_statistic, u_test_p_value,
+            levene_statistic, levene_p_value,
+            treatment_median, treatment_std,
+            control_median, control_std))))
     return {
         'u_test_statistic': u_test_statistic,
         'u_test_p_value': u_test_p_value,
@@ -187,6 +289,159 @@ def compare_means_and_variances_in_groups(
     }
 
 
+def compare_means_and_variances_in_groups_batch(
+        processed_data,
+        HRV_methods,
+        saving_folder,
+        alternative='two-sided'):
+    """
+    Prepare the same statistical tests as
+    compare_means_and_variances_in_groups() for several HRV methods
+    at once, using single vectorized Mann-Whitney U-test and Levene's test.
+
+    Parameters:
+    ----------
+      *processed_data*: (Pandas Dataframe) contains (at least) columns:
+                        group to distinguish patients from the control group
+                        and 'HRV_{name of the method used}' for each method
+                        from *HRV_methods*
+      *HRV_methods*: (list of strings) names of the methods used
+                     for calculation of the HRV values
+      *saving_folder*: (string) contains path to the folder where results
+                       should be saved
+      *alternative*: (string) defines the alternative hypothesis
+                     of the U-test: 'two-sided' (default), 'less'
+                     or 'greater'
+
+    Returns:
+    --------
+    A dictionary with the names of methods as keys and dictionaries
+    returned by compare_means_and_variances_in_groups() as values.
+    """
+    control_indices, treatment_indices = get_group_indices(processed_data)
+    # One row for each method, extracted from the dataframe at once
+    values = processed_data[
+        [f'HRV_{HRV_method}' for HRV_method in HRV_methods]
+    ].to_numpy(np.float64).T
+    control_values = values[:, control_indices]
+    treatment_values = values[:, treatment_indices]
+
+    # Each row corresponds to one HRV method
+    u_test_statistics, u_test_p_values = mannwhitneyu(
+        treatment_values,
+        control_values,
+        alternative=alternative,
+        axis=1
+    )
+    levene_statistics, levene_p_values = levene(
+        treatment_values,
+        control_values,
+        center='median',
+        axis=1
+    )
+
+    # Descriptive statistics for all methods at once
+    treatment_medians, treatment_stds = medians_and_stds(treatment_values)
+    control_medians, control_stds = medians_and_stds(control_values)
+
+    rows = list(zip(u_test_statistics, u_test_p_values,
+                    levene_statistics, levene_p_values,
+                    treatment_medians, treatment_stds,
+                    control_medians, control_stds))
+    return save_statistical_tests_results(saving_folder, HRV_methods, rows)
+
+
+def run_tests_parallel(processed_data,
+                       HRV_methods,
+                       saving_folder,
+                       max_workers=None):
+    """
+    Prepare the same statistical tests as
+    compare_means_and_variances_in_groups() for several HRV methods,
+    running tests for consecutive methods in parallel threads.
+
+    Parameters:
+    ----------
+      *processed_data*: (Pandas Dataframe) contains (at least) columns:
+                        group to distinguish patients from the control group
+                        and 'HRV_{name of the method used}' for each method
+                        from *HRV_methods*
+      *HRV_methods*: (list of strings) names of the methods used
+                     for calculation of the HRV values
+      *saving_folder*: (string) contains path to the folder where results
+                       should be saved
+      *max_workers*: (int) optional, the maximal number of threads
+
+    Returns:
+    --------
+    A dictionary with the names of methods as keys and dictionaries
+    returned by compare_means_and_variances_in_groups() as values.
+    """
+    control_indices, treatment_indices = get_group_indices(processed_data)
+
+    def run_tests(HRV_method):
+        values = processed_data[f'HRV_{HRV_method}'].to_numpy(np.float64)
+        control_values = values[control_indices]
+        treatment_values = values[treatment_indices]
+        u_test_statistic, u_test_p_value = mannwhitneyu(
+            treatment_values,
+            control_values
+        )
+        levene_statistic, levene_p_value = levene(
+            treatment_values,
+            control_values
+        )
+        return ((u_test_statistic, u_test_p_value,
+                 levene_statistic, levene_p_value) +
+                medians_and_stds(treatment_values) +
+                medians_and_stds(control_values))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        rows = list(executor.map(run_tests, HRV_methods))
+    return save_statistical_tests_results(saving_folder, HRV_methods, rows)
+
+
+def save_statistical_tests_results(saving_folder,
+                                   HRV_methods,
+                                   rows):
+    """
+    Save results of statistical tests for several HRV methods
+    to the file 'statistical_tests_results_HRV_methods.csv'
+    (one row for each method).
+
+    Parameters:
+    ----------
+      *saving_folder*: (string) contains path to the folder where results
+                       should be saved
+      *HRV_methods*: (list of strings) names of the methods used
+                     for calculation of the HRV values
+      *rows*: (list of tuples) for each method: U-test statistic, p-value,
+              Levene's test statistic, p-value, median and std in the
+              treatment group, median and std in the control group
+
+    Returns:
+    --------
+    A dictionary with the names of methods as keys and dictionaries
+    returned by compare_means_and_variances_in_groups() as values.
+    """
+    results = {}
+    # Rows start with the name of the method, so they are kept apart from
+    # results saved by compare_means_and_variances_in_groups()
+    path = f'{saving_folder}/statistical_tests_results_HRV_methods.csv'
+    with open_csv_appender(path) as stream:
+        writer = csv.writer(stream, delimiter=';', lineterminator='\n')
+        writer.writerow(('method',) + STATISTICAL_TESTS_HEADER)
+        for HRV_method, row in zip(HRV_methods, rows):
+            writer.writerow((HRV_method,) + tuple(map(float, row)))
+            results[HRV_method] = {
+                'u_test_statistic': row[0],
+                'u_test_p_value': row[1],
+                'levene_statistic': row[2],
+                'levene_p_value': row[3]
+            }
+    return results
+
+
 def filter_accelerometer_outlier_data(dataframe):
     """
     Filter out accelerometer values excedding the 1.5 interquantile range
@@ -201,28 +456,16 @@ def filter_accelerometer_outlier_data(dataframe):
     --------
         Pandas DataFrame with filtered outliers, separately for each group
     """
-    dataframe = dataframe.copy()
-    groups = ['control', 'treatment']
-    whiskers_ranges = {}
-    filtered_dataframes = []
-    for group in groups:
-        individual_values = dataframe.loc[
-            dataframe['key'] == group]['ACC_mean'].values
-        quartile_1 = np.percentile(individual_values, 25)
-        quartile_3 = np.percentile(individual_values, 75)
+    values = dataframe['ACC_mean'].to_numpy()
+    inliers = np.zeros(len(dataframe), dtype=bool)
+    for group_indices in get_group_indices(dataframe, 'key'):
+        group_values = values[group_indices]
+        quartile_1, quartile_3 = np.quantile(group_values, [0.25, 0.75])
         whiskers_range = 1.5 * (quartile_3 - quartile_1)
-        inliers_range = [quartile_1 - whiskers_range,
-                         quartile_3 + whiskers_range]
-        whiskers_ranges[group] = inliers_range
-        filtered_dataframes.append(
-            dataframe.loc[
-                (dataframe['key'] == group) & (
-                    (dataframe['ACC_mean'] <= whiskers_ranges[group][1]) &
-                    (dataframe['ACC_mean'] >= whiskers_ranges[group][0]))
-                ]
-        )
-    filtered_dataframes = pd.concat(filtered_dataframes)
-    return filtered_dataframes
+        inliers[group_indices] = (
+            (group_values <= quartile_3 + whiskers_range) &
+            (group_values >= quartile_1 - whiskers_range))
+    return dataframe.loc[inliers]
 
 
 if __name__ == "__main__":
@@ -53,7 +53,9 @@ import csv
 import pandas as pd
 from typing import Tuple
 
-from HRV_calculation import calculate_mean_HRV_based_on_windows
+from HRV_calculation import (
+    calculate_mean_HRV_based_on_windows_for_all_persons
+)
 
 
 def save_results(results: pd.DataFrame,
@@ -67,7 +69,9 @@ def save_results(results: pd.DataFrame,
     ----------
       *results* (Pandas Dataframe) contains results from all patients
       *parameters* (dictionary) stores information about experiment
-                   and parameters required for saving
+                   and parameters required for saving; the optional key
+                   'results_format' selects the format of the table
+                   saved next to the pickle file (see save_table)
 
     Returns:
     --------
@@ -79,23 +83,51 @@ def save_results(results: pd.DataFrame,
     results.to_pickle(
         f'{parameters["plot_saving_folder"]}/'
         f'results_{parameters["name"]}.pkl')
+    if "results_format" in parameters:
+        results_format = parameters["results_format"]
+    else:
+        results_format = 'csv'
     if parameters['sequence_range'] == 'full':
-        results.to_csv(
-            f'{parameters["plot_saving_folder"]}/'
-            f'results_{parameters["name"]}.csv')
+        save_table(results,
+                   f'{parameters["plot_saving_folder"]}/'
+                   f'results_{parameters["name"]}',
+                   results_format)
     elif parameters['sequence_range'] == 'windows':
-        results = results.apply(
-            lambda x: calculate_mean_HRV_based_on_windows(
-                x, method=parameters['method']), axis=1
-        )
+        results[f'HRV_{parameters["method"]}'] = \
+            calculate_mean_HRV_based_on_windows_for_all_persons(
+                results, method=parameters['method'])
         results = results.drop('timestamps', axis=1)
-        results.to_csv(
-            f'{parameters["plot_saving_folder"]}/'
-            f'mean_results_{parameters["name"]}.csv')
+        save_table(results,
+                   f'{parameters["plot_saving_folder"]}/'
+                   f'mean_results_{parameters["name"]}',
+                   results_format)
     treatment_results = results.loc[results['group'] == 'treatment']
     return (results, treatment_results)
 
 
+def save_table(results: pd.DataFrame,
+               path_without_extension: str,
+               results_format: str | None) -> None:
+    """
+    Save a table with results in the selected format.
+
+    Arguments:
+    ----------
+      *results* (Pandas Dataframe) table to save
+      *path_without_extension* (string) folder and name of the file
+      *results_format* (string or None) 'csv', 'parquet' (requires pyarrow
+                       or fastparquet) or None (the table is not saved)
+    """
+    if results_format == 'csv':
+        results.to_csv(f'{path_without_extension}.csv')
+    elif results_format == 'parquet':
+        results.to_parquet(f'{path_without_extension}.parquet',
+                           compression='snappy')
+    elif results_format is not None:
+        raise ValueError('Wrong format of results! '
+                         'Possible options: "csv", "parquet" or None.')
+
+
 def save_parameters(parameters: dict,
                     name: str = 'parameters') -> None:
     """
@@ -108,11 +140,15 @@ def save_parameters(parameters: dict,
       *name* (string) optional argument defining name of the file
              for saving parameters
     """
+    # Numpy values are converted to plain Python objects once, so that
+    # their representation in the file does not depend on numpy
+    values = [value.tolist() if hasattr(value, 'tolist') else value
+              for value in parameters.values()]
     with open(f"{parameters['plot_saving_folder']}/"
               f"{name}.csv", 'w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=parameters.keys())
-        writer.writeheader()
-        writer.writerow(parameters)
+        writer = csv.writer(file)
+        writer.writerow(parameters.keys())
+        writer.writerow(values)
 
 
 if __name__ == "__main__":